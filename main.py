@@ -47,8 +47,8 @@ require_auth()
 load_user_orgs()
 
 # ─── Global CSS ──────────────────────────────────────────────────────────────
-from styles import get_app_css
-st.markdown(get_app_css(), unsafe_allow_html=True)
+from styles import get_css
+st.markdown(get_css("critical"), unsafe_allow_html=True)
 
 
 # ─── Header ──────────────────────────────────────────────────────────────────
@@ -128,9 +128,9 @@ def stat_cards_html(cards: list) -> str:
     cards: list of (value, label, color_class)
     """
     inner = ""
-    for value, label, color in cards:
-        inner += '<div class="stat-card {c}"><div class="stat-value">{v}</div><div class="stat-label">{l}</div></div>'.format(
-            c=color, v=value, l=label)
+    for i, (value, label, color) in enumerate(cards, 1):
+        inner += '<div class="stat-card {c}" style="--card-i:{i}"><div class="stat-value">{v}</div><div class="stat-label">{l}</div></div>'.format(
+            c=color, i=i, v=value, l=label)
     return '<div class="stat-row">{}</div>'.format(inner)
 
 
@@ -222,7 +222,7 @@ def render_results_table(df):
     )
 
     rows_html = ""
-    for _, row in df.iterrows():
+    for i, (_, row) in enumerate(df.iterrows(), 1):
         cells = ""
         for col in available_cols:
             val = str(row.get(col, ""))
@@ -236,7 +236,7 @@ def render_results_table(df):
             elif col == "type":
                 val = val.upper() if val else ""
             cells += "<td>{}</td>".format(val)
-        rows_html += "<tr>{}</tr>".format(cells)
+        rows_html += '<tr style="--row-i:{}">{}</tr>'.format(i, cells)
 
     st.markdown(
         '<table class="results-table"><thead><tr>{h}</tr></thead><tbody>{r}</tbody></table>'.format(
@@ -299,6 +299,11 @@ with st.sidebar:
         st.rerun()
 
 
+# ─── Deferred CSS (cards, tables, charts) ────────────────────────────────────
+# Emitted after the shell has rendered; must stay above the first st.stop().
+st.markdown(get_css("deferred"), unsafe_allow_html=True)
+
+
 # ─── Tabs ────────────────────────────────────────────────────────────────────
 tab1, tab2, tab3, tab4 = st.tabs(["Generate Tests", "Execute", "Results", "Export"])
 
@@ -819,7 +824,7 @@ with tab3:
                 fig = create_styled_bar_chart(
                     labels=status_counts.index.tolist(),
                     values=status_counts.values.tolist(),
-                    colors=[STATUS_COLORS.get(s, "#808098") for s in status_counts.index],
+                    colors=status_counts.index.to_series().map(STATUS_COLORS).fillna("#808098").tolist(),
                 )
                 st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
 
@@ -830,7 +835,7 @@ with tab3:
                     fig = create_styled_bar_chart(
                         labels=type_counts.index.tolist(),
                         values=type_counts.values.tolist(),
-                        colors=[TYPE_COLORS.get(t, "#808098") for t in type_counts.index],
+                        colors=type_counts.index.to_series().map(TYPE_COLORS).fillna("#808098").tolist(),
                     )
                     st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
 
@@ -5,11 +5,18 @@ Supports Web URL + BRD documents + Custom Instructions.
 """
 
 
+import concurrent.futures
+import copy
+import hashlib
+import http.cookiejar
+import threading
 import time
 import re
 import json
 import socket
 import ipaddress
+from collections import OrderedDict
+from functools import lru_cache
 from dataclasses import dataclass, field
 from typing import List, Dict, Tuple, Optional
 from urllib.parse import urlparse
@@ -17,8 +24,13 @@ import os
 
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.exceptions import InsecureRequestWarning
-from bs4 import BeautifulSoup
+from requests.packages.urllib3 import exceptions as urllib3_exceptions
+from requests.packages.urllib3.util.request import ACCEPT_ENCODING
+from requests.compat import chardet
+import lxml.html
+from lxml import etree
 from openai import OpenAI
 from tenacity import retry, stop_after_attempt, wait_exponential
 from dotenv import load_dotenv
@@ -26,6 +38,11 @@ import pypdf
 
 from logger import get_logger
 
+try:
+    import orjson  # optional: faster JSON encode/decode
+except ImportError:
+    orjson = None
+
 load_dotenv()
 
 logger = get_logger(__name__)
@@ -34,8 +51,59 @@ logger = get_logger(__name__)
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 MODEL_NAME = os.getenv("MODEL_NAME", "gpt-4o-mini")
 
-
-@dataclass
+# Shared across calls so the underlying httpx pool keeps its TLS connections (client is thread-safe)
+_OPENAI_CLIENT = OpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    # Only advertise codecs urllib3 can decode here (adds br/zstd when installed)
+    'Accept-Encoding': ACCEPT_ENCODING,
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+# Shared session: keep-alive + connection pooling across scrape_website calls.
+# Cookies are never persisted in the shared jar, so one user's scrape cannot
+# leak consent/session cookies into the next; redirects within a call still carry them.
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_SESSION.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+_adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=0)
+_SESSION.mount("http://", _adapter)
+_SESSION.mount("https://", _adapter)
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Generated test cases keyed by a hash of every prompt input (LRU, per process)
+GENERATION_CACHE_SIZE = 128
+_GENERATION_CACHE: "OrderedDict[str, List[Dict]]" = OrderedDict()
+_GENERATION_CACHE_LOCK = threading.Lock()
+
+# Feature flag -> keywords searched for in the lowercased page HTML
+FEATURE_KEYWORDS = {
+    "has_search": ("search", 'type="search"'),
+    "has_auth": ("login", "signin", "signup", "register", "auth"),
+    "is_ecommerce": ("product", "cart", "checkout", "price", "shop"),
+    "has_comments": ("comment", "review"),
+}
+
+# Tags whose content never contributes to extracted text/buttons
+_NOISE_TAGS = ("script", "style", "meta", "link", "noscript")
+# The same noise removed from the raw markup so feature keywords never match
+# inline JS/CSS or meta/link attributes (e.g. "auth" in <meta name="author">)
+_NOISE_MARKUP_RE = re.compile(
+    r"<(script|style|noscript)\b.*?</\1\s*>|<(?:meta|link)\b[^>]*>",
+    re.IGNORECASE | re.DOTALL,
+)
+_UTF8_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+# SSRF verdicts are cached per hostname for this long (seconds) to honour DNS changes
+DNS_CACHE_TTL = 300
+
+
+@dataclass(slots=True)
 class ExtractedWebsiteData:
     """Structured data extracted from website."""
     url: str
@@ -81,17 +149,43 @@ def validate_and_normalize_url(url: str) -> Tuple[bool, str]:
         hostname = parsed.hostname
         if not hostname:
             return False, ""
-        for info in socket.getaddrinfo(hostname, None):
-            ip = ipaddress.ip_address(info[4][0])
-            if ip.is_private or ip.is_reserved or ip.is_loopback or ip.is_link_local:
-                logger.warning("SSRF blocked: %s resolves to private/reserved IP %s", url, ip)
-                return False, ""
+        try:
+            literal_ip = ipaddress.ip_address(hostname)
+        except ValueError:
+            literal_ip = None
+        if literal_ip is not None:
+            # Literal IPs are classified directly, no DNS round-trip
+            blocked_ip = str(literal_ip) if _is_blocked_ip(literal_ip) else None
+        else:
+            blocked_ip = _resolve_and_classify(hostname, int(time.monotonic() // DNS_CACHE_TTL))
+        if blocked_ip:
+            logger.warning("SSRF blocked: %s resolves to private/reserved IP %s", url, blocked_ip)
+            return False, ""
     except (socket.gaierror, ValueError):
         return False, ""
 
     return True, url
 
 
+@lru_cache(maxsize=1024)
+def _resolve_and_classify(hostname: str, ttl_bucket: int) -> Optional[str]:
+    """
+    Resolve hostname and return the first private/reserved IP it maps to, or None.
+
+    ttl_bucket only expires cache entries; failed lookups raise and are not cached.
+    """
+    for info in socket.getaddrinfo(hostname, None):
+        ip = ipaddress.ip_address(info[4][0])
+        if _is_blocked_ip(ip):
+            return str(ip)
+    return None
+
+
+def _is_blocked_ip(ip) -> bool:
+    """True if ip is private, reserved, loopback or link-local (not safe to fetch)."""
+    return ip.is_private or ip.is_reserved or ip.is_loopback or ip.is_link_local
+
+
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=10))
 def scrape_website(url: str) -> str:
     """
@@ -109,26 +203,16 @@ def scrape_website(url: str) -> str:
     """
     logger.info("Loading website: %s", url)
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1'
-    }
-    
     try:
-        response = requests.get(
+        with _SESSION.get(
             url, 
-            headers=headers, 
             timeout=30,
             allow_redirects=True,
-            verify=True
-        )
-        response.raise_for_status()
-        
-        html = response.text
+            verify=True,
+            stream=True
+        ) as response:
+            response.raise_for_status()
+            html = _read_text(response)
         
         logger.info("Successfully loaded %s characters", f"{len(html):,}")
         return html
@@ -144,15 +228,15 @@ def scrape_website(url: str) -> str:
         import warnings
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=InsecureRequestWarning)
-            response = requests.get(
+            with _SESSION.get(
                 url,
-                headers=headers,
                 timeout=30,
                 allow_redirects=True,
-                verify=False
-            )
-        response.raise_for_status()
-        html = response.text
+                verify=False,
+                stream=True
+            ) as response:
+                response.raise_for_status()
+                html = _read_text(response)
         logger.info("Loaded %s chars (SSL verification disabled)", f"{len(html):,}")
         return html
     except Exception as e:
@@ -160,6 +244,67 @@ def scrape_website(url: str) -> str:
         raise
 
 
+def _read_text(response: requests.Response) -> str:
+    """
+    Read a streamed response body and decode it in a single pass.
+
+    Avoids response.text, which keeps the raw bytes alongside the decoded str.
+    Charset resolution mirrors requests: declared encoding, else detection.
+
+    Raises:
+        requests.RequestException: If reading the body fails; urllib3 errors are
+            translated the way requests does, so mid-body timeouts are requests.Timeout
+    """
+    try:
+        body = response.raw.read(decode_content=True)
+    except urllib3_exceptions.ReadTimeoutError as e:
+        raise requests.exceptions.ReadTimeout(e, response=response)
+    except urllib3_exceptions.ProtocolError as e:
+        raise requests.exceptions.ChunkedEncodingError(e, response=response)
+    except urllib3_exceptions.DecodeError as e:
+        raise requests.exceptions.ContentDecodingError(e, response=response)
+    except urllib3_exceptions.SSLError as e:
+        raise requests.exceptions.SSLError(e, response=response)
+    except urllib3_exceptions.HTTPError as e:
+        raise requests.exceptions.ConnectionError(e, response=response)
+    encoding = response.encoding or chardet.detect(body)["encoding"] or "utf-8"
+    try:
+        return body.decode(encoding, errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+def scrape_many(urls: List[str], max_concurrency: int = 8) -> List[Dict]:
+    """
+    Scrape several URLs concurrently with bounded parallelism.
+
+    Each URL is SSRF-validated before fetching. Failures are reported per URL
+    instead of aborting the whole batch.
+
+    Args:
+        urls: Website URLs to scrape
+        max_concurrency: Maximum number of requests in flight
+
+    Returns:
+        List of dicts with 'url', 'html' and 'error' keys, in input order
+        (compatible with aggregate_crawl_data)
+    """
+    def _scrape_one(url: str) -> Dict:
+        is_valid, normalized = validate_and_normalize_url(url)
+        if not is_valid:
+            return {"url": url, "html": "", "error": "Invalid or blocked URL"}
+        try:
+            return {"url": normalized, "html": scrape_website(normalized), "error": ""}
+        except Exception as e:
+            return {"url": normalized, "html": "", "error": str(e)}
+
+    if not urls:
+        return []
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_concurrency, len(urls))) as pool:
+        return list(pool.map(_scrape_one, urls))
+
+
 def extract_website_intelligence(html: str, url: str) -> ExtractedWebsiteData:
     """
     Extract structured data from HTML.
@@ -172,90 +317,96 @@ def extract_website_intelligence(html: str, url: str) -> ExtractedWebsiteData:
         ExtractedWebsiteData with all extracted information
     """
     errors = []
-    soup = BeautifulSoup(html, "html.parser")
-    
-    # Remove noise
-    for tag in soup(["script", "style", "meta", "link", "noscript"]):
-        tag.decompose()
+    # Noise-free lowercased markup for feature keywords, without re-serializing the tree
+    lower_html = _NOISE_MARKUP_RE.sub("", html).lower()
+    doc = _parse_html(html)
     
-    # Extract title
+    # Read the description before meta tags are stripped as noise
     try:
-        title = soup.title.string.strip() if soup.title and soup.title.string else "Untitled"
-    except Exception as e:
-        title = "Untitled"
-        errors.append(f"Title extraction: {e}")
-    
-    # Extract description
-    try:
-        desc_tag = soup.find("meta", attrs={"name": "description"})
-        description = desc_tag["content"].strip() if desc_tag and desc_tag.get("content") else ""
+        desc_content = doc.xpath("string((//meta[@name='description'])[1]/@content)")
+        description = desc_content.strip()
     except Exception as e:
         description = ""
         errors.append(f"Description extraction: {e}")
     
-    # Extract forms
+    # Remove noise (keep tail text that follows the removed elements)
+    etree.strip_elements(doc, *_NOISE_TAGS, with_tail=False)
+    
+    # Single pass over the remaining tree fills every bucket
+    title = "Untitled"
     forms = []
+    form_index = {}
+    button_tags = []
+    dom = {"header": False, "nav": False, "main": False, "footer": False, "sections": 0, "articles": 0}
     try:
-        for form in soup.find_all("form")[:10]:
-            form_data = {
-                "method": (form.get("method") or "GET").upper(),
-                "action": form.get("action") or "",
-                "inputs": [],
-            }
-            for inp in form.find_all(["input", "textarea", "select"])[:15]:
-                form_data["inputs"].append({
-                    "type": inp.get("type") or inp.name,
-                    "name": inp.get("name") or "",
-                    "placeholder": inp.get("placeholder") or "",
-                    "required": inp.has_attr("required"),
-                })
-            forms.append(form_data)
+        for el in doc.iter(etree.Element):
+            tag = el.tag
+            if tag == "title":
+                if title == "Untitled":
+                    title = el.text_content().strip() or "Untitled"
+            elif tag == "form":
+                if len(forms) < 10:
+                    form_index[el] = len(forms)
+                    forms.append({
+                        "method": (el.get("method") or "GET").upper(),
+                        "action": el.get("action") or "",
+                        "inputs": [],
+                    })
+            elif tag in ("header", "nav", "main", "footer"):
+                dom[tag] = True
+            elif tag == "section":
+                dom["sections"] += 1
+            elif tag == "article":
+                dom["articles"] += 1
+
+            if tag in ("button", "a", "input"):
+                button_tags.append(el)
+
+            if tag in ("input", "textarea", "select") and form_index:
+                parent_form = next(el.iterancestors("form"), None)
+                idx = form_index.get(parent_form) if parent_form is not None else None
+                if idx is not None and len(forms[idx]["inputs"]) < 15:
+                    forms[idx]["inputs"].append({
+                        "type": el.get("type") or tag,
+                        "name": el.get("name") or "",
+                        "placeholder": el.get("placeholder") or "",
+                        "required": el.get("required") is not None,
+                    })
     except Exception as e:
-        errors.append(f"Form extraction: {e}")
+        errors.append(f"DOM traversal: {e}")
     
     # Extract buttons
-    buttons = []
+    seen = {}  # insertion-ordered set of unique labels
     try:
-        for btn in soup.find_all(["button", "a", "input"]):
-            text = (btn.get_text() or btn.get("value") or "").strip()
-            if text and 0 < len(text) <= 40:
-                buttons.append(text)
-        buttons = sorted(list(set(buttons)))[:30]
+        for btn in button_tags:
+            text = ((btn.text_content() if btn.tag != "input" else "") or btn.get("value") or "").strip()
+            if 0 < len(text) <= 40 and text not in seen:
+                seen[text] = None
+                if len(seen) == 30:
+                    break
     except Exception as e:
         errors.append(f"Button extraction: {e}")
+    buttons = list(seen)
     
     # Extract text content
     try:
-        text = " ".join(soup.get_text(separator=" ", strip=True).split())
-        text_summary = text[:16000]
+        text_summary = _bounded_text(doc, limit=16000)
     except Exception as e:
         text_summary = ""
         errors.append(f"Text extraction: {e}")
     
     # Detect features
     try:
-        lower_html = str(soup).lower()
-        features = {
-            "has_forms": bool(forms),
-            "has_search": any(k in lower_html for k in ["search", 'type="search"']),
-            "has_auth": any(k in lower_html for k in ["login", "signin", "signup", "register", "auth"]),
-            "is_ecommerce": any(k in lower_html for k in ["product", "cart", "checkout", "price", "shop"]),
-            "has_comments": "comment" in lower_html or "review" in lower_html,
-        }
+        features = {"has_forms": bool(forms)}
+        for feature, keywords in FEATURE_KEYWORDS.items():
+            features[feature] = any(k in lower_html for k in keywords)
     except Exception as e:
         features = {}
         errors.append(f"Feature detection: {e}")
     
     # Extract DOM structure
     try:
-        dom_structure = json.dumps({
-            "header": bool(soup.find("header")),
-            "nav": bool(soup.find("nav")),
-            "main": bool(soup.find("main")),
-            "footer": bool(soup.find("footer")),
-            "sections": len(soup.find_all("section")),
-            "articles": len(soup.find_all("article")),
-        }, indent=2)
+        dom_structure = _compact_json(dom)
     except Exception as e:
         dom_structure = "{}"
         errors.append(f"DOM structure: {e}")
@@ -275,6 +426,35 @@ def extract_website_intelligence(html: str, url: str) -> ExtractedWebsiteData:
     )
 
 
+def _parse_html(html: str) -> lxml.html.HtmlElement:
+    """Parse HTML into an lxml document, tolerating empty input and XML encoding declarations."""
+    try:
+        try:
+            return lxml.html.document_fromstring(html)
+        except ValueError:
+            # lxml rejects str input carrying an encoding declaration; re-parse as UTF-8 bytes
+            return lxml.html.document_fromstring(html.encode("utf-8"), parser=_UTF8_HTML_PARSER)
+    except etree.ParserError:
+        # Empty / comment-only documents, including a bare XML declaration
+        return lxml.html.document_fromstring("<html></html>")
+
+
+def _bounded_text(root: lxml.html.HtmlElement, limit: int = 16000) -> str:
+    """Whitespace-normalized text of root, truncated to limit; stops walking once the budget is met."""
+    parts = []
+    length = 0
+    for chunk in root.itertext():
+        words = chunk.split()
+        if not words:
+            continue
+        piece = " ".join(words)
+        length += len(piece) + (1 if parts else 0)
+        parts.append(piece)
+        if length >= limit:
+            break
+    return " ".join(parts)[:limit]
+
+
 def aggregate_crawl_data(pages: List[Dict], token_budget: int = 12000) -> str:
     """
     Merge HTML from multiple crawled pages into a single string within a token budget.
@@ -304,6 +484,44 @@ def aggregate_crawl_data(pages: List[Dict], token_budget: int = 12000) -> str:
     return "".join(combined)
 
 
+def _compact_json(obj) -> str:
+    """Serialize obj for prompts: no indentation or padding, non-ASCII kept verbatim (fewer tokens)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def _json_loads(text: str):
+    """Parse JSON text, via orjson when installed (its errors subclass json.JSONDecodeError)."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _generation_cache_key(source: Dict, instruction: str, extracted: ExtractedWebsiteData, coverage: str, site_map: Optional[Dict[str, List[str]]]) -> str:
+    """Hash the canonicalized generation inputs (plus MODEL_NAME) into a cache key."""
+    payload = {
+        "model": MODEL_NAME,
+        "url": extracted.url,
+        "title": extracted.title,
+        "description": extracted.description,
+        "features": extracted.features,
+        "forms": extracted.forms,
+        "buttons": extracted.buttons,
+        "dom_structure": extracted.dom_structure,
+        "text_summary": extracted.text_summary,
+        "source": source,
+        "instruction": instruction,
+        "coverage": coverage,
+        "site_map": site_map,
+    }
+    if orjson is not None:
+        canonical = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+    else:
+        canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+    return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
+
 def generate_test_cases(source: Dict, instruction: str, extracted: ExtractedWebsiteData, coverage: str, site_map: Optional[Dict[str, List[str]]] = None) -> List[Dict]:
     """
     Generate test cases using OpenAI from Web + BRD + Instructions.
@@ -321,11 +539,19 @@ def generate_test_cases(source: Dict, instruction: str, extracted: ExtractedWebs
         RuntimeError: If OPENAI_API_KEY not set
         ValueError: If LLM doesn't return valid JSON
     """
-    if not OPENAI_API_KEY:
+    if _OPENAI_CLIENT is None:
         raise RuntimeError("OPENAI_API_KEY not set in environment")
     
-    # Thread-safe client initialization
-    client = OpenAI(api_key=OPENAI_API_KEY)
+    client = _OPENAI_CLIENT
+
+    cache_key = _generation_cache_key(source, instruction, extracted, coverage, site_map)
+    with _GENERATION_CACHE_LOCK:
+        cached = _GENERATION_CACHE.get(cache_key)
+        if cached is not None:
+            _GENERATION_CACHE.move_to_end(cache_key)
+    if cached is not None:
+        logger.info("Test generation cache hit (%d test cases)", len(cached))
+        return copy.deepcopy(cached)
     
     coverage_map = {
         "basic": "3-4",
@@ -350,7 +576,7 @@ CRITICAL SAFETY RULES:
 - If payment elements detected, test ONLY page load + basic navigation
 '''
     
-    user_prompt = f"""Generate {coverage_label} test cases.
+    parts = [f"""Generate {coverage_label} test cases.
 
 WEBSITE DATA (if available):
 - URL: {extracted.url}
@@ -358,10 +584,10 @@ WEBSITE DATA (if available):
 - Description: {extracted.description}
 
 DETECTED FEATURES:
-{json.dumps(extracted.features, indent=2)}
+{_compact_json(extracted.features)}
 
 FORMS:
-{json.dumps(extracted.forms, indent=2)}
+{_compact_json(extracted.forms)}
 
 BUTTONS:
 {', '.join(extracted.buttons[:20])}
@@ -372,21 +598,23 @@ DOM STRUCTURE:
 CONTENT SAMPLE:
 {extracted.text_summary[:2000]}
 
-"""
+"""]
 
     # CRITICAL: ACTIVATE source + instruction params (3 lines added)
     if source:
-        user_prompt += f"\n\nADDITIONAL SOURCES (BRD/Requirements):\n{json.dumps(source, indent=2)}"
+        parts.append(f"\n\nADDITIONAL SOURCES (BRD/Requirements):\n{_compact_json(source)}")
     if instruction:
-        user_prompt += f"\n\nCUSTOM PRIORITIES:\n{instruction}"
+        parts.append(f"\n\nCUSTOM PRIORITIES:\n{instruction}")
     if site_map:
-        user_prompt += "\n\nSITE MAP (page → linked pages):\n"
-        for parent, children in list(site_map.items())[:30]:
-            user_prompt += f"  {parent} → {', '.join(children[:10])}\n"
-        user_prompt += "\nGenerate cross-page navigation tests that verify links between these pages work correctly."
-    user_prompt += "\n\n"
+        parts.append("\n\nSITE MAP (page → linked pages):\n")
+        parts.extend(
+            f"  {parent} → {', '.join(children[:10])}\n"
+            for parent, children in list(site_map.items())[:30]
+        )
+        parts.append("\nGenerate cross-page navigation tests that verify links between these pages work correctly.")
+    parts.append("\n\n")
 
-    user_prompt += """
+    parts.append("""
 Requirements:
 - Mix of positive, negative, and edge cases (at least 30% negative/edge)
 - Each test case must be concrete and automatable
@@ -396,19 +624,22 @@ Requirements:
 
 Use this exact JSON schema:
 
-[
-  {
-    "id": 1,
-    "type": "positive",
-    "title": "Test title",
-    "description": "What is being tested",
-    "expected_result": "Expected outcome",
-    "steps": ["Step 1", "Step 2"]
-  }
-]
-
-Return ONLY the JSON array, no explanation, no markdown.
-"""
+{
+  "tests": [
+    {
+      "id": 1,
+      "type": "positive",
+      "title": "Test title",
+      "description": "What is being tested",
+      "expected_result": "Expected outcome",
+      "steps": ["Step 1", "Step 2"]
+    }
+  ]
+}
+
+Return ONLY the JSON object, no explanation, no markdown.
+""")
+    user_prompt = "".join(parts)
     
     min_tests = int(coverage_label.split("-")[0])
 
@@ -422,22 +653,34 @@ Return ONLY the JSON array, no explanation, no markdown.
 
         # Allow up to 2 attempts: retry if model returns too few tests
         for attempt in range(2):
-            resp = client.chat.completions.create(
+            # JSON mode guarantees a parseable object; the retry pass is deterministic
+            stream = client.chat.completions.create(
                 model=MODEL_NAME,
                 messages=messages,
-                temperature=0.4,
+                temperature=0.4 if attempt == 0 else 0,
+                response_format={"type": "json_object"},
+                stream=True,
             )
 
-            text = resp.choices[0].message.content
-
-            # Extract JSON from response
-            start = text.find("[")
-            end = text.rfind("]") + 1
+            text = "".join(
+                chunk.choices[0].delta.content or ""
+                for chunk in stream
+                if chunk.choices
+            )
 
-            if start == -1 or end == 0:
-                raise ValueError("Model did not return a JSON array")
+            try:
+                payload = _json_loads(text)
+            except json.JSONDecodeError:
+                # Tolerate prose around the object (e.g. a backend ignoring response_format):
+                # raw_decode consumes exactly one value and ignores whatever trails it
+                start = text.find("{")
+                if start == -1:
+                    raise
+                payload, _end = _JSON_DECODER.raw_decode(text, start)
+            test_cases = payload.get("tests") if isinstance(payload, dict) else None
 
-            test_cases = json.loads(text[start:end])
+            if not isinstance(test_cases, list):
+                raise ValueError("Model did not return a JSON object with a 'tests' array")
 
             if len(test_cases) >= min_tests:
                 break
@@ -450,10 +693,17 @@ Return ONLY the JSON array, no explanation, no markdown.
                     "Even for a simple website, generate tests for: page load, title check, "
                     "link navigation, responsive layout, broken links, 404 handling, meta tags, "
                     "accessibility basics, and basic content verification. "
-                    "Return the FULL JSON array with at least {} test cases.".format(min_tests)
+                    "Return the FULL JSON object with at least {} test cases in \"tests\".".format(min_tests)
                 )})
 
         logger.info("Generated %d test cases", len(test_cases))
+        # Short results are not cached so retrying the same input asks the model again
+        if len(test_cases) >= min_tests:
+            with _GENERATION_CACHE_LOCK:
+                _GENERATION_CACHE[cache_key] = copy.deepcopy(test_cases)
+                _GENERATION_CACHE.move_to_end(cache_key)
+                while len(_GENERATION_CACHE) > GENERATION_CACHE_SIZE:
+                    _GENERATION_CACHE.popitem(last=False)
         return test_cases
 
     except json.JSONDecodeError as e:
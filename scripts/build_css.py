@@ -0,0 +1,72 @@
+"""
+Build the static stylesheet for Marcus Intelligence.
+
+Writes the deferred app bundle (styles.DEFERRED_CSS) to
+static/marcus-deferred.<hash>.css along with precompressed .gz (gzip -9) and
+.br (Brotli, quality 11) siblings so a reverse proxy with
+`gzip_static on; brotli_static on;` can serve them as-is. The hash in the
+filename makes the files safe to cache as immutable. The critical bundle is
+always inlined and is not written out.
+
+Also writes marcus-preload.conf, an nginx include that adds a Link preload
+header for the current bundle and the Inter stylesheet to the HTML response.
+
+Usage (from the repo root):
+    python scripts/build_css.py [output_dir]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from styles import DEFERRED_CSS_FILENAME, FONT_CSS_URL, STATIC_CSS_URL, brotli, write_static_css
+
+DEFAULT_OUTPUT_DIR = "static"
+PRELOAD_CONF_FILENAME = "marcus-preload.conf"
+
+
+def link_header() -> str:
+    """
+    Build the Link header value that preloads the deferred bundle and Inter.
+
+    nopush stops HTTP/2 servers that still honour push from re-sending files
+    the client already has cached.
+    """
+    css_url = "{}/{}".format(STATIC_CSS_URL or "/static", DEFERRED_CSS_FILENAME)
+    return ", ".join((
+        "<{}>; rel=preload; as=style; nopush".format(css_url),
+        "<https://fonts.gstatic.com>; rel=preconnect; crossorigin",
+        "<{}>; rel=preload; as=style; nopush".format(FONT_CSS_URL),
+    ))
+
+
+def build(output_dir: str = DEFAULT_OUTPUT_DIR) -> str:
+    """
+    Write the stylesheet, its compressed variants and the preload include.
+
+    Args:
+        output_dir: Directory to write into (created if missing).
+
+    Returns:
+        Path of the uncompressed .css file.
+    """
+    css_path = write_static_css(output_dir)
+    if brotli is None:
+        print("  brotli not installed - skipping {}.br".format(DEFERRED_CSS_FILENAME))
+
+    # Include from the HTML location only, not /static/, to keep asset responses small.
+    with open(os.path.join(output_dir, PRELOAD_CONF_FILENAME), "w", encoding="utf-8") as fh:
+        fh.write("add_header Link '{}';\n".format(link_header()))
+
+    for suffix in ("", ".gz", ".br"):
+        if os.path.exists(css_path + suffix):
+            print("  {:<40} {:>7,} bytes".format(
+                os.path.basename(css_path + suffix), os.path.getsize(css_path + suffix)))
+    return css_path
+
+
+if __name__ == "__main__":
+    out = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_OUTPUT_DIR
+    print("Building {}".format(DEFERRED_CSS_FILENAME))
+    build(out)
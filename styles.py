@@ -3,11 +3,35 @@ Centralized CSS for Marcus Intelligence.
 Premium agency-quality styling — raw HTML/CSS, no Python-driven layout.
 """
 
+import gzip
+import hashlib
+import os
+import re
+from typing import Dict, Final, Tuple
+
+from logger import get_logger
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+log = get_logger("styles")
+
 # ── Font preload + Design tokens ─────────────────────────────────────────────
+# Inter is loaded through <link> tags emitted ahead of the stylesheet rather than
+# a CSS @import, so the font CSS is fetched in parallel instead of after parse.
 
-CSS_TOKENS = """
-@import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800;900&display=swap');
+FONT_CSS_URL = "https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800;900&display=swap"
 
+FONT_LINKS_HTML = (
+    '<link rel="preconnect" href="https://fonts.googleapis.com">'
+    '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+    '<link rel="preload" as="style" href="{0}">'
+    '<link rel="stylesheet" href="{0}">'
+).format(FONT_CSS_URL)
+
+CSS_TOKENS = """
 :root {
     /* ── Core palette ────────────────────────── */
     --bg-0: #080618;
@@ -67,6 +91,9 @@ CSS_TOKENS = """
     --duration-slow: 0.4s;
 
     --font: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, sans-serif;
+
+    /* ── Textures ─────────────────────────────── */
+    --noise-url: url("data:image/svg+xml,%3Csvg viewBox='0 0 256 256' xmlns='http://www.w3.org/2000/svg'%3E%3Cfilter id='n'%3E%3CfeTurbulence type='fractalNoise' baseFrequency='0.9' numOctaves='4' stitchTiles='stitch'/%3E%3C/filter%3E%3Crect width='100%25' height='100%25' filter='url(%23n)' opacity='0.02'/%3E%3C/svg%3E");
 }
 """
 
@@ -133,13 +160,19 @@ p, li, td, th, label, span {
     content: '';
     position: fixed;
     inset: 0;
-    background-image: url("data:image/svg+xml,%3Csvg viewBox='0 0 256 256' xmlns='http://www.w3.org/2000/svg'%3E%3Cfilter id='n'%3E%3CfeTurbulence type='fractalNoise' baseFrequency='0.9' numOctaves='4' stitchTiles='stitch'/%3E%3C/filter%3E%3Crect width='100%25' height='100%25' filter='url(%23n)' opacity='0.02'/%3E%3C/svg%3E");
+    background-image: var(--noise-url);
     background-repeat: repeat;
     background-size: 256px 256px;
     pointer-events: none;
     z-index: 0;
     opacity: 0.5;
 }
+
+/* ── Dividers ────────────────────────── */
+hr {
+    border-color: var(--border-1) !important;
+    opacity: 0.6;
+}
 """
 
 # ── Header ────────────────────────────────────────────────────────────────────
@@ -273,7 +306,6 @@ CSS_TABS = """
     border-radius: var(--radius-md) var(--radius-md) 0 0;
     border-bottom: 1px solid var(--border-2);
     padding: 0 0.25rem;
-    backdrop-filter: blur(12px);
     position: relative;
 }
 [data-baseweb="tab"] {
@@ -320,7 +352,6 @@ CSS_STAT_CARDS = """
     border-radius: var(--radius-md);
     padding: 1rem 1.1rem;
     border: 1px solid var(--border-1);
-    backdrop-filter: blur(16px);
     transition: all var(--duration) var(--ease-out);
     position: relative;
     overflow: hidden;
@@ -354,20 +385,22 @@ CSS_STAT_CARDS = """
 }
 
 .stat-purple { background: linear-gradient(135deg, rgba(102,126,234,0.1), rgba(118,75,162,0.06)); }
-.stat-purple .stat-value { color: #a78bfa; }
-.stat-purple .stat-label { color: #a78bfa; }
+.stat-purple .stat-value, .stat-purple .stat-label { color: #a78bfa; }
 .stat-green  { background: linear-gradient(135deg, rgba(52,211,153,0.1), rgba(52,211,153,0.04)); }
-.stat-green  .stat-value { color: var(--pass); }
-.stat-green  .stat-label { color: var(--pass); }
+.stat-green  .stat-value, .stat-green  .stat-label { color: var(--pass); }
 .stat-red    { background: linear-gradient(135deg, rgba(248,113,113,0.1), rgba(248,113,113,0.04)); }
-.stat-red    .stat-value { color: var(--fail); }
-.stat-red    .stat-label { color: var(--fail); }
+.stat-red    .stat-value, .stat-red    .stat-label { color: var(--fail); }
 .stat-blue   { background: linear-gradient(135deg, rgba(96,165,250,0.1), rgba(96,165,250,0.04)); }
-.stat-blue   .stat-value { color: var(--blue); }
-.stat-blue   .stat-label { color: var(--blue); }
+.stat-blue   .stat-value, .stat-blue   .stat-label { color: var(--blue); }
 .stat-amber  { background: linear-gradient(135deg, rgba(251,191,36,0.1), rgba(251,191,36,0.04)); }
-.stat-amber  .stat-value { color: var(--amber); }
-.stat-amber  .stat-label { color: var(--amber); }
+.stat-amber  .stat-value, .stat-amber  .stat-label { color: var(--amber); }
+
+/* ── Staggered stat card entrance ───── */
+/* Stagger set per card via style="--card-i:N" (1-based), capped at card 6 */
+.stat-row .stat-card {
+    animation: scaleIn 0.35s var(--ease-spring) backwards;
+    animation-delay: calc(min(var(--card-i, 0), 6) * 40ms);
+}
 """
 
 # ── Status badges ─────────────────────────────────────────────────────────────
@@ -492,7 +525,6 @@ CSS_CARDS = """
     border-radius: var(--radius-md);
     padding: 1rem 1.2rem;
     margin-bottom: 0.6rem;
-    backdrop-filter: blur(16px);
     transition: all var(--duration) var(--ease-out);
 }
 .tc-card:hover {
@@ -519,20 +551,21 @@ CSS_CARDS = """
     border-radius: var(--radius-lg);
     padding: 1.3rem 1.5rem;
     margin: 0.75rem 0;
-    backdrop-filter: blur(16px);
     position: relative;
     overflow: hidden;
     box-shadow: var(--shadow-md);
 }
-/* Animated top bar */
+/* Animated top bar: two gradient periods slid by one period, on the compositor */
 .monitor-card::before {
     content: '';
     position: absolute;
-    top: 0; left: 0; right: 0;
+    top: 0; left: 0;
+    width: 600%;
     height: 2px;
     background: linear-gradient(90deg, var(--accent), var(--blue), var(--accent-2), var(--accent));
-    background-size: 300% 100%;
-    animation: shimmer-gradient 3s linear infinite;
+    background-size: 50% 100%;
+    animation: slide-half 1.5s linear infinite;
+    will-change: transform;
 }
 
 /* ── Report card ──────────────────── */
@@ -542,7 +575,6 @@ CSS_CARDS = """
     border-radius: var(--radius-lg);
     padding: 1.6rem 1.8rem;
     margin-top: 1rem;
-    backdrop-filter: blur(16px);
     transition: all var(--duration) var(--ease-out);
     position: relative;
 }
@@ -573,6 +605,14 @@ CSS_CARDS = """
     color: var(--text-3);
     font-weight: 600;
 }
+
+/* ── Off-screen skipping ──────────── */
+/* content-visibility implies layout/paint/style containment; the auto
+   intrinsic size is replaced by the real height once a card has rendered. */
+.tc-card, .stat-card, .monitor-card, .report-card {
+    content-visibility: auto;
+    contain-intrinsic-size: auto 120px;
+}
 """
 
 # ── Results table ─────────────────────────────────────────────────────────────
@@ -609,19 +649,11 @@ CSS_TABLES = """
     border-bottom: 1px solid var(--border-1);
     transition: all var(--duration) var(--ease-out);
 }
+/* Stagger set per row via style="--row-i:N" (1-based), capped at row 10 */
 .results-table tbody tr {
     animation: fadeInUp 0.3s var(--ease-out) backwards;
+    animation-delay: calc(min(var(--row-i, 0), 10) * 20ms);
 }
-.results-table tbody tr:nth-child(1)  { animation-delay: 0.02s; }
-.results-table tbody tr:nth-child(2)  { animation-delay: 0.04s; }
-.results-table tbody tr:nth-child(3)  { animation-delay: 0.06s; }
-.results-table tbody tr:nth-child(4)  { animation-delay: 0.08s; }
-.results-table tbody tr:nth-child(5)  { animation-delay: 0.1s;  }
-.results-table tbody tr:nth-child(6)  { animation-delay: 0.12s; }
-.results-table tbody tr:nth-child(7)  { animation-delay: 0.14s; }
-.results-table tbody tr:nth-child(8)  { animation-delay: 0.16s; }
-.results-table tbody tr:nth-child(9)  { animation-delay: 0.18s; }
-.results-table tbody tr:nth-child(10) { animation-delay: 0.2s;  }
 .results-table tr:hover td {
     background: var(--glass-3);
 }
@@ -647,7 +679,6 @@ CSS_METRICS = """
     border: 1px solid var(--border-1);
     border-radius: var(--radius-md);
     padding: 0.85rem 1rem;
-    backdrop-filter: blur(16px);
     transition: all var(--duration) var(--ease-out);
 }
 [data-testid="stMetric"]:hover {
@@ -667,9 +698,9 @@ CSS_METRICS = """
 }
 """
 
-# ── Component overrides ──────────────────────────────────────────────────────
+# ── Inputs (text, text area, select) ──────────────────────────────────────────
 
-CSS_COMPONENT_OVERRIDES = """
+CSS_INPUTS = """
 /* ── Text inputs ─────────────────────── */
 [data-testid="stTextInput"] input {
     background: var(--glass-2) !important;
@@ -680,17 +711,6 @@ CSS_COMPONENT_OVERRIDES = """
     padding: 0.6rem 0.8rem !important;
     transition: all var(--duration) var(--ease-out);
 }
-[data-testid="stTextInput"] input::placeholder { color: var(--text-5) !important; }
-[data-testid="stTextInput"] input:focus {
-    border-color: var(--accent) !important;
-    box-shadow: 0 0 0 3px rgba(102,126,234,0.12), var(--shadow-sm) !important;
-    background: var(--glass-3) !important;
-}
-[data-testid="stTextInput"] label {
-    color: var(--text-3) !important;
-    font-size: 0.78rem !important;
-    font-weight: 600 !important;
-}
 
 /* ── Text areas ──────────────────────── */
 [data-testid="stTextArea"] textarea {
@@ -701,17 +721,6 @@ CSS_COMPONENT_OVERRIDES = """
     font-size: 0.85rem !important;
     transition: all var(--duration) var(--ease-out);
 }
-[data-testid="stTextArea"] textarea::placeholder { color: var(--text-5) !important; }
-[data-testid="stTextArea"] textarea:focus {
-    border-color: var(--accent) !important;
-    box-shadow: 0 0 0 3px rgba(102,126,234,0.12), var(--shadow-sm) !important;
-    background: var(--glass-3) !important;
-}
-[data-testid="stTextArea"] label {
-    color: var(--text-3) !important;
-    font-size: 0.78rem !important;
-    font-weight: 600 !important;
-}
 
 /* ── Select boxes ────────────────────── */
 [data-testid="stSelectbox"] > div > div {
@@ -723,12 +732,28 @@ CSS_COMPONENT_OVERRIDES = """
 [data-testid="stSelectbox"] > div > div:hover {
     border-color: var(--border-4) !important;
 }
+
+/* ── Shared states and labels ────────── */
+[data-testid="stTextInput"] input::placeholder,
+[data-testid="stTextArea"] textarea::placeholder { color: var(--text-5) !important; }
+[data-testid="stTextInput"] input:focus,
+[data-testid="stTextArea"] textarea:focus {
+    border-color: var(--accent) !important;
+    box-shadow: 0 0 0 3px rgba(102,126,234,0.12), var(--shadow-sm) !important;
+    background: var(--glass-3) !important;
+}
+[data-testid="stTextInput"] label,
+[data-testid="stTextArea"] label,
 [data-testid="stSelectbox"] label {
     color: var(--text-3) !important;
     font-size: 0.78rem !important;
     font-weight: 600 !important;
 }
+"""
 
+# ── Buttons ───────────────────────────────────────────────────────────────────
+
+CSS_BUTTONS = """
 /* ── Primary buttons ─────────────────── */
 [data-testid="stBaseButton-primary"] {
     background: linear-gradient(135deg, var(--accent), var(--accent-2)) !important;
@@ -779,6 +804,28 @@ CSS_COMPONENT_OVERRIDES = """
     box-shadow: var(--shadow-sm);
 }
 
+/* ── Download buttons ────────────────── */
+[data-testid="stDownloadButton"] button {
+    background: var(--glass-2) !important;
+    border: 1px solid var(--border-2) !important;
+    border-radius: var(--radius-sm) !important;
+    font-weight: 600 !important;
+    font-size: 0.82rem !important;
+    transition: all var(--duration) var(--ease-out);
+    color: var(--text-2) !important;
+}
+[data-testid="stDownloadButton"] button:hover {
+    border-color: rgba(102,126,234,0.25) !important;
+    background: rgba(102,126,234,0.06) !important;
+    color: var(--text-0) !important;
+    box-shadow: var(--shadow-sm);
+    transform: translateY(-1px);
+}
+"""
+
+# ── File uploader ─────────────────────────────────────────────────────────────
+
+CSS_UPLOADER = """
 /* ── File uploader ───────────────────── */
 [data-testid="stFileUploader"] {
     border: 1.5px dashed var(--border-2) !important;
@@ -796,7 +843,11 @@ CSS_COMPONENT_OVERRIDES = """
     font-size: 0.78rem !important;
     font-weight: 600 !important;
 }
+"""
 
+# ── Expanders ─────────────────────────────────────────────────────────────────
+
+CSS_EXPANDER = """
 /* ── Expanders ───────────────────────── */
 [data-testid="stExpander"] {
     background: var(--glass-2) !important;
@@ -813,7 +864,11 @@ CSS_COMPONENT_OVERRIDES = """
     font-weight: 600 !important;
     font-size: 0.84rem !important;
 }
+"""
+
+# ── Progress bar ──────────────────────────────────────────────────────────────
 
+CSS_PROGRESS = """
 /* ── Progress bar ────────────────────── */
 [data-testid="stProgress"] > div > div {
     background: rgba(255,255,255,0.04) !important;
@@ -823,54 +878,32 @@ CSS_COMPONENT_OVERRIDES = """
 }
 [data-testid="stProgress"] > div > div > div {
     background: linear-gradient(90deg, var(--accent), var(--accent-2), var(--blue)) !important;
-    background-size: 200% 100%;
     border-radius: 10px !important;
     position: relative;
     overflow: hidden;
-    animation: shimmer-gradient 2s linear infinite;
 }
 [data-testid="stProgress"] > div > div > div::after {
     content: '';
     position: absolute;
-    top: 0; left: -100%;
+    top: 0; left: 0;
     width: 100%; height: 100%;
     background: linear-gradient(90deg, transparent, rgba(255,255,255,0.2), transparent);
     animation: shimmer 1.5s linear infinite;
+    will-change: transform;
 }
+"""
 
-/* ── Download buttons ────────────────── */
-[data-testid="stDownloadButton"] button {
-    background: var(--glass-2) !important;
-    border: 1px solid var(--border-2) !important;
-    border-radius: var(--radius-sm) !important;
-    font-weight: 600 !important;
-    font-size: 0.82rem !important;
-    transition: all var(--duration) var(--ease-out);
-    color: var(--text-2) !important;
-}
-[data-testid="stDownloadButton"] button:hover {
-    border-color: rgba(102,126,234,0.25) !important;
-    background: rgba(102,126,234,0.06) !important;
-    color: var(--text-0) !important;
-    box-shadow: var(--shadow-sm);
-    transform: translateY(-1px);
-}
+# ── Alerts and spinner ────────────────────────────────────────────────────────
 
+CSS_ALERTS = """
 /* ── Alerts ──────────────────────────── */
 [data-testid="stAlert"] {
     border-radius: var(--radius-sm) !important;
-    backdrop-filter: blur(12px);
     border: 1px solid var(--border-2) !important;
     border-left: 3px solid var(--accent) !important;
     font-size: 0.84rem;
 }
 
-/* ── Dividers ────────────────────────── */
-hr {
-    border-color: var(--border-1) !important;
-    opacity: 0.6;
-}
-
 /* ── Spinner ─────────────────────────── */
 [data-testid="stSpinner"] {
     color: var(--accent) !important;
@@ -900,34 +933,14 @@ CSS_ANIMATIONS = """
     from { transform: translateX(-100%); }
     to   { transform: translateX(100%); }
 }
-@keyframes shimmer-gradient {
-    0%   { background-position: 0% 50%; }
-    100% { background-position: 300% 50%; }
+@keyframes slide-half {
+    from { transform: translateX(0); }
+    to   { transform: translateX(-50%); }
 }
 @keyframes pulse {
     0%, 100% { opacity: 1; }
     50%      { opacity: 0.4; }
 }
-@keyframes gradientShift {
-    0%   { background-position: 0% 50%; }
-    50%  { background-position: 100% 50%; }
-    100% { background-position: 0% 50%; }
-}
-@keyframes float {
-    0%, 100% { transform: translateY(0px); }
-    50%      { transform: translateY(-6px); }
-}
-
-/* ── Staggered stat card entrance ───── */
-.stat-row .stat-card {
-    animation: scaleIn 0.35s var(--ease-spring) backwards;
-}
-.stat-row .stat-card:nth-child(1) { animation-delay: 0.04s; }
-.stat-row .stat-card:nth-child(2) { animation-delay: 0.08s; }
-.stat-row .stat-card:nth-child(3) { animation-delay: 0.12s; }
-.stat-row .stat-card:nth-child(4) { animation-delay: 0.16s; }
-.stat-row .stat-card:nth-child(5) { animation-delay: 0.20s; }
-.stat-row .stat-card:nth-child(6) { animation-delay: 0.24s; }
 """
 
 # ── Charts (Plotly container) ─────────────────────────────────────────────────
@@ -958,7 +971,7 @@ CSS_LOGIN = """
     content: '';
     position: fixed;
     inset: 0;
-    background-image: url("data:image/svg+xml,%3Csvg viewBox='0 0 256 256' xmlns='http://www.w3.org/2000/svg'%3E%3Cfilter id='n'%3E%3CfeTurbulence type='fractalNoise' baseFrequency='0.9' numOctaves='4' stitchTiles='stitch'/%3E%3C/filter%3E%3Crect width='100%25' height='100%25' filter='url(%23n)' opacity='0.02'/%3E%3C/svg%3E");
+    background-image: var(--noise-url);
     background-repeat: repeat;
     background-size: 256px 256px;
     pointer-events: none;
@@ -1054,41 +1067,247 @@ CSS_LOGIN = """
     animation: fadeIn 0.5s var(--ease-out) 0.6s backwards;
     letter-spacing: 0.03em;
 }
+
+/* ── Login-only keyframes ─────────── */
+@keyframes gradientShift {
+    0%   { background-position: 0% 50%; }
+    50%  { background-position: 100% 50%; }
+    100% { background-position: 0% 50%; }
+}
+@keyframes float {
+    0%, 100% { transform: translateY(0px); }
+    50%      { transform: translateY(-6px); }
+}
 """
 
 
+# ── Bundling ──────────────────────────────────────────────────────────────────
+# Sections are joined and minified once at import; every rerun reuses the result.
+# The app bundle is split so only the shell (tokens, layout, header, sidebar
+# and its metrics, tabs, inputs, buttons, alerts, keyframes) is inlined ahead of
+# the page; results styling (cards, tables, badges, charts) and the uploader,
+# expander and progress widgets are injected after it. The login page gets only the
+# components it renders.
+
+_CRITICAL_SECTIONS = (
+    CSS_TOKENS,
+    CSS_BASE,
+    CSS_HEADER,
+    CSS_SIDEBAR,
+    CSS_METRICS,
+    CSS_TABS,
+    CSS_SECTION_HEADERS,
+    CSS_EMPTY_STATES,
+    CSS_INPUTS,
+    CSS_BUTTONS,
+    CSS_ALERTS,
+    CSS_ANIMATIONS,
+)
+
+_DEFERRED_SECTIONS = (
+    CSS_STAT_CARDS,
+    CSS_BADGES,
+    CSS_CARDS,
+    CSS_TABLES,
+    CSS_UPLOADER,
+    CSS_EXPANDER,
+    CSS_PROGRESS,
+    CSS_CHARTS,
+)
+
+_APP_SECTIONS = _CRITICAL_SECTIONS + _DEFERRED_SECTIONS
+
+_LOGIN_SECTIONS = (
+    CSS_TOKENS,
+    CSS_BASE,
+    CSS_LOGIN,
+    CSS_TABS,
+    CSS_INPUTS,
+    CSS_BUTTONS,
+    CSS_ALERTS,
+    CSS_ANIMATIONS,
+)
+
+# Set MARCUS_DEBUG_CSS=1 to ship the sections unminified (readable in devtools).
+DEBUG_CSS: Final[bool] = bool(os.getenv("MARCUS_DEBUG_CSS"))
+
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_SPACE_RE = re.compile(r"\s+")
+_CSS_PUNCT_RE = re.compile(r"\s*([{};,>~/])\s*")
+_CSS_LEADING_ZERO_RE = re.compile(r"(?<=[\s:,(/])0\.(\d)")
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments, redundant whitespace and leading zeros (keeps spaces around + for calc())."""
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_SPACE_RE.sub(" ", css)
+    css = _CSS_PUNCT_RE.sub(r"\1", css)
+    css = _CSS_LEADING_ZERO_RE.sub(r".\1", css)
+    css = css.replace(": ", ":").replace(" !important", "!important").replace(";}", "}")
+    return css.strip()
+
+
+# :root stays in the output because main.py's inline HTML uses the tokens too.
+_CSS_TOKEN_DEF_RE = re.compile(r"--([\w-]+):([^;}]+)")
+_CSS_VAR_RE = re.compile(r"var\(--([\w-]+)\)")
+_TOKENS: Dict[str, str] = dict(_CSS_TOKEN_DEF_RE.findall(_minify_css(CSS_TOKENS)))
+
+
+def _inline_token(match: "re.Match[str]") -> str:
+    value = _TOKENS.get(match.group(1))
+    if value is None or "var(" in value or len(value) >= len(match.group(0)):
+        return match.group(0)
+    return value
+
+
+def _bundle(sections: Tuple[str, ...]) -> str:
+    """
+    Join sections into one stylesheet, minified unless DEBUG_CSS is set.
+
+    Minifying also replaces var(--token) outside :root with the token's value
+    wherever the literal is shorter (colors, radii, durations).
+    """
+    if DEBUG_CSS:
+        return "\n".join(sections)
+    return "".join(
+        _minify_css(section) if section is CSS_TOKENS
+        else _CSS_VAR_RE.sub(_inline_token, _minify_css(section))
+        for section in sections
+    )
+
+
+CRITICAL_CSS: Final[str] = _bundle(_CRITICAL_SECTIONS)
+DEFERRED_CSS: Final[str] = _bundle(_DEFERRED_SECTIONS)
+FULL_CSS: Final[str] = CRITICAL_CSS + DEFERRED_CSS
+LOGIN_CSS: Final[str] = _bundle(_LOGIN_SECTIONS)
+
+# Encoded once for the byte consumers (content hash, static file writer).
+DEFERRED_CSS_BYTES: Final[bytes] = DEFERRED_CSS.encode("utf-8")
+
+
+def _with_fonts(css: str) -> str:
+    """
+    Wrap css in <style> tags alongside the font links.
+
+    The links normally go first so the font fetch starts early. Unminified CSS
+    has blank lines, which end a Markdown HTML block that opened with <link>,
+    so in debug mode the <style> block (which runs to </style>) leads instead.
+    """
+    style = "<style>" + css + "</style>"
+    return style + FONT_LINKS_HTML if DEBUG_CSS else FONT_LINKS_HTML + style
+
+
+CRITICAL_CSS_HTML: Final[str] = _with_fonts(CRITICAL_CSS)
+DEFERRED_CSS_HTML: Final[str] = "<style>" + DEFERRED_CSS + "</style>"
+FULL_CSS_HTML: Final[str] = _with_fonts(FULL_CSS)
+LOGIN_CSS_HTML: Final[str] = _with_fonts(LOGIN_CSS)
+
+# When set (e.g. "/static"), the deferred bundle is linked from a static,
+# precompressed file instead of being inlined. Streamlit's own static handler
+# serves .css as text/plain, so this needs a reverse proxy in front. If
+# MARCUS_STATIC_CSS_DIR names the directory that proxy serves, the file is
+# written there at startup; otherwise run scripts/build_css.py at deploy time.
+STATIC_CSS_URL: Final[str] = os.getenv("MARCUS_STATIC_CSS_URL", "").rstrip("/")
+STATIC_CSS_DIR: Final[str] = os.getenv("MARCUS_STATIC_CSS_DIR", "")
+
+# Content-hashed so the file can be served with a year-long immutable
+# Cache-Control; any CSS change produces a new URL.
+CSS_VERSION: Final[str] = hashlib.sha1(DEFERRED_CSS_BYTES).hexdigest()[:10]
+DEFERRED_CSS_FILENAME: Final[str] = "marcus-deferred.{}.css".format(CSS_VERSION)
+
+
+def _write_if_absent(path: str, data: bytes) -> None:
+    if os.path.exists(path):
+        return
+    # Write-then-rename so a concurrently starting process never serves a partial file.
+    tmp = "{}.{}.tmp".format(path, os.getpid())
+    with open(tmp, "wb") as fh:
+        fh.write(data)
+    os.replace(tmp, path)
+
+
+def write_static_css(output_dir: str) -> str:
+    """
+    Write the deferred bundle and its .gz/.br variants unless already present.
+
+    The filename is content-hashed, so an existing file always has the right bytes.
+
+    Args:
+        output_dir: Directory to write into (created if missing).
+
+    Returns:
+        Path of the uncompressed .css file.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    css_path = os.path.join(output_dir, DEFERRED_CSS_FILENAME)
+    data = DEFERRED_CSS_BYTES
+
+    _write_if_absent(css_path, data)
+    # mtime=0 keeps the .gz byte-identical across builds of the same CSS.
+    _write_if_absent(css_path + ".gz", gzip.compress(data, compresslevel=9, mtime=0))
+    if brotli is not None:
+        _write_if_absent(css_path + ".br", brotli.compress(data, quality=11, mode=brotli.MODE_TEXT))
+
+    return css_path
+
+
+def _publish_deferred_css() -> str:
+    """Return the URL the deferred bundle is served from, or "" to inline it."""
+    if not STATIC_CSS_URL:
+        return ""
+    if STATIC_CSS_DIR:
+        try:
+            write_static_css(STATIC_CSS_DIR)
+        except OSError as e:
+            log.warning("Could not write static CSS to %s, inlining instead: %s", STATIC_CSS_DIR, e)
+            return ""
+    return "{}/{}".format(STATIC_CSS_URL, DEFERRED_CSS_FILENAME)
+
+
+DEFERRED_CSS_URL: Final[str] = _publish_deferred_css()
+
+
+# Precomputed markup per view; the deferred entry is a <link> in static mode.
+_BUNDLES: Dict[str, str] = {
+    "app": FULL_CSS_HTML,
+    "critical": CRITICAL_CSS_HTML,
+    "deferred": (
+        '<link rel="stylesheet" href="{}">'.format(DEFERRED_CSS_URL)
+        if DEFERRED_CSS_URL else DEFERRED_CSS_HTML
+    ),
+    "login": LOGIN_CSS_HTML,
+}
+
+
 # ── Public API ────────────────────────────────────────────────────────────────
 
+def get_css(view: str) -> str:
+    """
+    Return the CSS markup to inject for a view.
+
+    Args:
+        view: "critical" / "deferred" for the two halves of the main app,
+              "app" for both at once, or "login".
+
+    Returns:
+        HTML for st.markdown(..., unsafe_allow_html=True).
+
+    Raises:
+        ValueError: If the view has no bundle.
+    """
+    try:
+        return _BUNDLES[view]
+    except KeyError:
+        raise ValueError(
+            "Unknown CSS view '{}'; expected one of {}".format(view, sorted(_BUNDLES))
+        ) from None
+
+
 def get_app_css() -> str:
-    """Return the full CSS for the main application wrapped in <style> tags."""
-    sections = [
-        CSS_TOKENS,
-        CSS_BASE,
-        CSS_HEADER,
-        CSS_SIDEBAR,
-        CSS_TABS,
-        CSS_STAT_CARDS,
-        CSS_BADGES,
-        CSS_SECTION_HEADERS,
-        CSS_EMPTY_STATES,
-        CSS_CARDS,
-        CSS_TABLES,
-        CSS_METRICS,
-        CSS_COMPONENT_OVERRIDES,
-        CSS_ANIMATIONS,
-        CSS_CHARTS,
-    ]
-    return "<style>\n{}\n</style>".format("\n".join(sections))
+    """Return the font links and full CSS for the main application wrapped in <style> tags."""
+    return get_css("app")
 
 
 def get_login_css() -> str:
-    """Return the CSS for the login page wrapped in <style> tags."""
-    sections = [
-        CSS_TOKENS,
-        CSS_BASE,
-        CSS_LOGIN,
-        CSS_TABS,
-        CSS_COMPONENT_OVERRIDES,
-        CSS_ANIMATIONS,
-    ]
-    return "<style>\n{}\n</style>".format("\n".join(sections))
\ No newline at end of file
+    """Return the font links and CSS for the login page wrapped in <style> tags."""
+    return get_css("login")